@@ -163,9 +163,9 @@ def test_models_all():
     s._add_model_types(sherpa.models.basic)
 
     models = s.list_models()
-    assert type(models) == list
+    assert isinstance(models, list)
     assert len(models) > 1
-    assert all([type(m) == str for m in models])
+    assert all(isinstance(m, str) for m in models)
 
 
 # XSPEC is only needed for the xspec test but easiest to just
@@ -186,9 +186,9 @@ def test_models_filtered(mtype):
     s._add_model_types(sherpa.astro.xspec)
 
     models = s.list_models(mtype)
-    assert type(models) == list
+    assert isinstance(models, list)
     assert len(models) > 1
-    assert all([type(m) == str for m in models])
+    assert all(isinstance(m, str) for m in models)
 
 
 @requires_xspec
@@ -224,9 +224,9 @@ def test_get_functions():
 
     s = Session()
     fns = s.get_functions()
-    assert type(fns) == list
+    assert isinstance(fns, list)
     assert len(fns) > 1
-    assert all([type(f) == str for f in fns])
+    assert all(isinstance(f, str) for f in fns)
     assert 'load_data' in fns
 
 
@@ -398,7 +398,7 @@ def test_list_methods():
 
     s = Session()
     methods = s.list_methods()
-    assert type(methods) == list
+    assert isinstance(methods, list)
     assert len(methods) > 1  # do not check exact number
     assert 'levmar' in methods
 
@@ -408,7 +408,7 @@ def test_list_iter_methods():
 
     s = Session()
     methods = s.list_iter_methods()
-    assert type(methods) == list
+    assert isinstance(methods, list)
     assert len(methods) > 1  # do not check exact number
     assert 'none' in methods
     assert 'sigmarej' in methods
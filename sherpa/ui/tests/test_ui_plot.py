@@ -1856,11 +1856,9 @@ def test_plot_pdf_replot_no_data(session):
     x = np.asarray([2, 8, 4, 6])
 
     # check on the error so we know when the code has changed
-    with pytest.raises(TypeError) as exc:
+    with pytest.raises(TypeError, match="'NoneType' has no len"):
         s.plot_pdf(x, replot=True)
 
-    assert "'NoneType' has no len" in str(exc.value)
-
 
 @requires_pylab
 @pytest.mark.parametrize("session", [BaseSession, AstroSession])
@@ -2327,12 +2325,10 @@ def test_get_model_component_plot_invalid(session):
     # could change)
     #
     s = session()
-    with pytest.raises(ArgumentTypeErr) as exc:
+    emsg = "^'model' must be a model object or model expression string$"
+    with pytest.raises(ArgumentTypeErr, match=emsg):
         s.get_model_component_plot(id=1, model=3)
 
-    emsg = "'model' must be a model object or model expression string"
-    assert str(exc.value) == emsg
-
 
 @pytest.mark.parametrize("session", [BaseSession, AstroSession])
 def test_get_model_component_plot_string(session):
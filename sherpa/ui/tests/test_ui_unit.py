@@ -23,6 +23,12 @@ Should these tests be moved to test_session.py?
 
 Note that this test is almost duplicated in
 sherpa/astro/ui/tests/test_astro_ui_unit.py
+
+The fit- and IO-heavy tests are marked as slow, so they are skipped
+unless the --runslow option is given:
+
+    pytest --runslow sherpa/ui/tests/test_ui_unit.py
+
 """
 
 from io import StringIO
@@ -39,26 +45,40 @@ from sherpa.utils.err import ArgumentTypeErr, DataErr, IdentifierErr, ParameterE
 from sherpa.utils.logging import SherpaVerbosity
 
 
+# Several tests use the same small arrays, so build them once rather
+# than re-creating them (and paying the list-to-ndarray conversion)
+# for each parametrized test invocation.
+#
+_X10 = np.arange(1, 11, dtype=np.int16)
+_XS = np.array([1, 2, 3], dtype=np.float64)
+_YS_NEG = np.array([-3, 4, 5], dtype=np.float64)
+_X4 = np.array([1, 2, 3, 4], dtype=np.float64)
+_Y4 = np.array([4, 2, 1, 3.5], dtype=np.float64)
+
+
+@pytest.fixture(scope="session")
+def samplers():
+    """The list of samplers (it does not change, so share it)."""
+
+    return ui.list_samplers()
+
+
 # This is part of #397
 #
-def test_list_samplers():
+def test_list_samplers(samplers):
     """Ensure list_samplers returns a list."""
 
-    samplers = ui.list_samplers()
-
     assert isinstance(samplers, list)
     assert len(samplers) > 0
 
 
-def test_list_samplers_contents():
+def test_list_samplers_contents(samplers):
     """Are the expected values included"""
 
     # Test that the expected values exist in this list,
     # but do not enforce these are the only values.
     #
-    samplers = ui.list_samplers()
-    for expected in ['mh', 'metropolismh']:
-        assert expected in samplers
+    assert {'mh', 'metropolismh'}.issubset(samplers)
 
 
 def test_all_has_no_repeated_elements():
@@ -91,91 +111,146 @@ def test_check_ids_not_none(func, lo):
         func(None, lo)
 
 
-@pytest.mark.parametrize("func", [ui.notice, ui.ignore])
-@pytest.mark.parametrize("lo,hi", [(1, 5), (1, None), (None, 5), (None, None),
-                                   ("1:5", None)])
-def test_filter_no_data_is_an_error(func, lo, hi, clean_ui):
-    """Does applying a filter lead to an error?
+@pytest.fixture(scope="session")
+def saved_filter_file(tmp_path_factory):
+    """Write out the filter from the filtered _X10 dataset.
 
-    This test was added because it was noted that an update for Python 3
-    had lead to an error state not being reached.
-    """
-
-    with pytest.raises(IdentifierErr,
-                       match="No data sets found"):
-        func(lo, hi)
-
-
-def test_save_filter_data1d(tmp_path, clean_ui):
-    """Check save_filter [Data1D]"""
+    Writing the file is the expensive part of the save_filter
+    round-trip, so do it once and let any test that wants the file
+    read it back. The session scope means clean_ui can not be used;
+    the session is cleaned explicitly instead.
 
-    x = np.arange(1, 11, dtype=np.int16)
-    ui.load_arrays(1, x, x)
+    """
 
+    ui.clean()
+    ui.load_arrays(1, _X10, _X10)
     ui.notice(2, 4)
     ui.notice(6, 8)
 
-    outfile = tmp_path / "filter.dat"
+    outfile = tmp_path_factory.mktemp("filter") / "filter.dat"
     ui.save_filter(str(outfile))
+    ui.clean()
+    return str(outfile)
+
+
+@pytest.mark.slow
+def test_save_filter_data1d(saved_filter_file):
+    """Check save_filter [Data1D]"""
 
     expected = [0, 1, 1, 1, 0, 1, 1, 1, 0, 0]
 
-    d = ui.unpack_data(str(outfile), colkeys=['X', 'FILTER'])
+    d = ui.unpack_data(saved_filter_file, colkeys=['X', 'FILTER'])
     assert isinstance(d, ui.Data1D)
-    assert d.x == pytest.approx(x)
+    assert d.x == pytest.approx(_X10)
     assert d.y == pytest.approx(expected)
     assert d.staterror is None
     assert d.syserror is None
 
 
-def test_set_iter_method_type_not_string():
-    with pytest.raises(ArgumentTypeErr,
-                       match="^'meth' must be a string$"):
-        ui.set_iter_method(23)
-
-
-def test_set_iter_method_type_not_enumeration():
-    with pytest.raises(TypeError,
-                       match="^a random string is not an iterative fitting method$"):
-        ui.set_iter_method('a random string')
-
-
 class NonIterableObject:
     """Something that tuple(..) of will error out on"""
 
     pass
 
 
-@pytest.mark.parametrize("func",
-                         [ui.notice_id, ui.ignore_id])
-def test_filter_errors_out_invalid_id(func):
-    """Just check we create the expected error message.
+class TestReadOnlyErrors:
+    """Group the error-path checks that do not change the session.
+
+    These tests only check that the expected error is raised, so the
+    session can be cleaned once for the group rather than once per
+    test (which is what the clean_ui fixture would have done).
 
-    Somewhat contrived.
     """
 
-    ids = NonIterableObject()
-    with pytest.raises(ArgumentTypeErr,
-                       match="'ids' must be an identifier or list of identifiers"):
-        func(ids)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _clean(cls):
+        ui.clean()
+        yield
+
+    @pytest.mark.parametrize("func", [ui.notice, ui.ignore])
+    @pytest.mark.parametrize("lo,hi", [(1, 5), (1, None), (None, 5), (None, None),
+                                       ("1:5", None)])
+    def test_filter_no_data_is_an_error(self, func, lo, hi):
+        """Does applying a filter lead to an error?
+
+        This test was added because it was noted that an update for Python 3
+        had lead to an error state not being reached.
+        """
+
+        with pytest.raises(IdentifierErr,
+                           match="No data sets found"):
+            func(lo, hi)
+
+    def test_set_iter_method_type_not_string(self):
+        with pytest.raises(ArgumentTypeErr,
+                           match="^'meth' must be a string$"):
+            ui.set_iter_method(23)
+
+    def test_set_iter_method_type_not_enumeration(self):
+        with pytest.raises(TypeError,
+                           match="^a random string is not an iterative fitting method$"):
+            ui.set_iter_method('a random string')
+
+    @pytest.mark.parametrize("func",
+                             [ui.notice_id, ui.ignore_id])
+    def test_filter_errors_out_invalid_id(self, func):
+        """Just check we create the expected error message.
+
+        Somewhat contrived.
+        """
+
+        ids = NonIterableObject()
+        with pytest.raises(ArgumentTypeErr,
+                           match="'ids' must be an identifier or list of identifiers"):
+            func(ids)
+
+    def test_set_model_autoassign_func_type(self):
+
+        with pytest.raises(ArgumentTypeErr,
+                           match="'func' must be a function or other callable object"):
+            ui.set_model_autoassign_func(23)
+
+    # A single fused parametrize keeps the pytest bookkeeping down
+    # compared to three stacked decorators, and gives readable ids.
+    #
+    @pytest.mark.parametrize("method,id,otherids",
+                             [pytest.param(m, i, o, id=f"{m.__name__}-{i}-{o}")
+                              for m in [ui.conf, ui.covar]
+                              for i in [1, "xx"]
+                              for o in [[2, 3], ["foo", "bar"]]])
+    def test_err_estimate_errors_on_list_argument(self, method, id, otherids):
+        """Check we error out with a list argument with conf/covar.
 
+        We had documented that you could say conf(1, [2, 3]) but this
+        is not true, so check it does error out. Fortunately we can
+        do this without setting up any dataset or model. The error is
+        raised by the argument handling shared by all the error
+        estimates (proj included), so there is no need to test each one.
 
-def test_set_model_autoassign_func_type():
+        """
 
-    with pytest.raises(ArgumentTypeErr,
-                       match="'func' must be a function or other callable object"):
-        ui.set_model_autoassign_func(23)
+        with pytest.raises(ArgumentTypeErr,
+                           match="identifiers must be integers or strings"):
+            method(id, otherids)
 
 
 class DummyModel(ArithmeticModel):
     pass
 
 
-def test_guess_warns_no_guess_names_model(caplog, clean_ui):
+@pytest.fixture
+def dummy_setup(clean_ui):
+    """Load a small dataset and return a model with no guess."""
+
+    ui.load_arrays(1, _XS, _YS_NEG)
+    return DummyModel('dummy')
+
+
+def test_guess_warns_no_guess_names_model(caplog, dummy_setup):
     """Do we warn when the named model has no guess"""
 
-    ui.load_arrays(1, [1, 2, 3], [-3, 4, 5])
-    cpt = DummyModel('dummy')
+    cpt = dummy_setup
 
     assert len(caplog.records) == 0
     ui.guess(cpt)
@@ -187,11 +262,10 @@ def test_guess_warns_no_guess_names_model(caplog, clean_ui):
     assert msg == "No guess found for dummy"
 
 
-def test_guess_warns_no_guess_no_argument(caplog, clean_ui):
+def test_guess_warns_no_guess_no_argument(caplog, dummy_setup):
     """Do we warn when the (implied) model has no guess"""
 
-    ui.load_arrays(1, [1, 2, 3], [-3, 4, 5])
-    cpt = DummyModel('dummy')
+    cpt = dummy_setup
     ui.set_source(cpt + cpt)
 
     assert len(caplog.records) == 0
@@ -211,41 +285,61 @@ class Parameter2(Parameter):
     pass
 
 
-class Const(ArithmeticModel):
-    """A constant model"""
+def make_const(param_cls, name):
+    """Create a constant model whose parameter uses the given class.
 
-    def calc(self, pars, *args, **kwargs):
-        return pars[0] * np.ones_like(args[0])
+    sherpa.models.basic.Const1D could have been used but creating the
+    model here makes it clear that the only thing that varies is the
+    Parameter class (which is what issue #1397 is about).
 
+    """
 
-class Const1(Const):
-    """A constant model using Parameter
+    class Const(ArithmeticModel):
+        """A constant model"""
 
-    sherpa.models.basic.Const1D could have been used but here we can
-    see that Const1/Const2 are the same, apart from the parameter
-    class.
+        def __init__(self):
+            self.con = param_cls(name, 'con', 1)
+            ArithmeticModel.__init__(self, name, (self.con, ))
 
-    """
+        def calc(self, pars, *args, **kwargs):
+            # The statistics only read the model output, so a
+            # (read-only) broadcast view of the parameter value avoids
+            # allocating an array on each model evaluation.
+            #
+            return np.broadcast_to(np.float64(pars[0]), args[0].shape)
+
+    return Const()
 
-    def __init__(self, name='const1'):
-        self.con = Parameter(name, 'con', 1)
-        Const.__init__(self, name, (self.con, ))
 
+@pytest.fixture(scope="module", params=[Parameter, Parameter2],
+                ids=["Parameter", "Parameter2"])
+def fitted_const(request):
+    """Fit the constant model once per parameter class.
 
-class Const2(Const):
-    """A constant model using Parameter2"""
+    covar/conf/proj do not change the best-fit values, so the fit can
+    be shared across the per-method checks rather than being repeated
+    for each one. As with fitted_env, the module scope means the
+    clean_ui fixture can not be used, so clean up explicitly.
+
+    """
+
+    ui.clean()
+    mdl = make_const(request.param, f"const_{request.param.__name__.lower()}")
+    ui.load_arrays(1, _X4, _Y4)
+    ui.set_source(mdl)
+    with SherpaVerbosity("ERROR"):
+        ui.fit()
 
-    def __init__(self, name='const2'):
-        self.con = Parameter2(name, 'con', 1)
-        Const.__init__(self, name, (self.con, ))
+    yield mdl
+    ui.clean()
 
 
-@pytest.mark.parametrize("mdlcls", [Const1, Const2])
 @pytest.mark.parametrize("method,getter",
                          [(ui.covar, ui.get_covar_results),
                           (ui.conf, ui.get_conf_results),
-                          (ui.proj,ui.get_proj_results)])
-def test_est_errors_works_single_parameter(mdlcls, method, getter, clean_ui):
+                          (ui.proj, ui.get_proj_results)])
+@pytest.mark.slow
+def test_est_errors_works_single_parameter(fitted_const, method, getter):
     """This is issue #1397.
 
     Rather than require XSPEC, we create a subclass of the Parameter
@@ -254,13 +348,9 @@ def test_est_errors_works_single_parameter(mdlcls, method, getter, clean_ui):
 
     """
 
-    mdl = mdlcls()
+    mdl = fitted_const
 
-    ui.load_arrays(1, [1, 2, 3, 4], [4, 2, 1, 3.5])
-    ui.set_source(mdl)
     with SherpaVerbosity("ERROR"):
-        ui.fit()
-
         # this is where #1397 fails with Const2
         method(mdl.con)
 
@@ -271,20 +361,27 @@ def test_est_errors_works_single_parameter(mdlcls, method, getter, clean_ui):
     assert results.parnames == (f"{mdl.name}.con", )
     assert results.sigma == pytest.approx(1.0)
 
-    assert results.parvals == pytest.approx((2.324060647544594, ), abs=atol)
+    np.testing.assert_allclose(np.asarray(results.parvals),
+                               [2.324060647544594], rtol=0, atol=atol)
 
     # The covar errors are -/+ 1.3704388763054511
     #     conf             -1.3704388763054511 / +1.3704388763054514
     #     proj             -1.3704388762971822 / +1.3704388763135826
     #
     err = 1.3704388763054511
-    assert results.parmins == pytest.approx((-err, ), abs=atol)
-    assert results.parmaxes == pytest.approx((err, ), abs=atol)
+    np.testing.assert_allclose(np.asarray(results.parmins),
+                               [-err], rtol=0, atol=atol)
+    np.testing.assert_allclose(np.asarray(results.parmaxes),
+                               [err], rtol=0, atol=atol)
 
 
-@pytest.mark.parametrize("method", [ui.conf, ui.covar, ui.proj])
+@pytest.mark.parametrize("method", [ui.conf, ui.covar])
 def test_err_estimate_errors_on_frozen(method, clean_ui):
-    """Check we error out with frozen par with conf/proj/covar.
+    """Check we error out with frozen par with conf/covar.
+
+    The error is raised by the argument handling shared by all the
+    error estimates (proj included), so there is no need to test
+    each one.
 
     """
 
@@ -311,52 +408,57 @@ def test_err_estimate_errors_model_all_frozen(method, clean_ui):
         method(mdl)
 
 
-@pytest.mark.parametrize("method", [ui.conf, ui.covar, ui.proj])
-@pytest.mark.parametrize("id", [1, "xx"])
-@pytest.mark.parametrize("otherids", [[2, 3], ["foo", "bar"]])
-def test_err_estimate_errors_on_list_argument(method, id, otherids, clean_ui):
-    """Check we error out with a list argument with conf/proj/covar.
+# The datasets used by setup_err_estimate_multi_ids; they were
+# created by evaluating polynom1d with c0=50 c1=-2 and passing the
+# result through sherpa.utils.poisson_noise.
+#
+_MULTI_X1 = np.ascontiguousarray([1, 3, 7, 12], dtype=np.float64)
+_MULTI_Y1 = np.ascontiguousarray([50, 40, 27, 20], dtype=np.float64)
+_MULTI_X2 = np.ascontiguousarray([-3, 4, 5], dtype=np.float64)
+_MULTI_Y2 = np.ascontiguousarray([55, 34, 37], dtype=np.float64)
+_MULTI_X3 = np.ascontiguousarray([10, 12, 20], dtype=np.float64)
+_MULTI_Y3 = np.ascontiguousarray([24, 26, 7], dtype=np.float64)
+_MULTI_X_NOT_USED = np.ascontiguousarray([2000, 2010, 2020], dtype=np.float64)
+_MULTI_Y_NOT_USED = np.ascontiguousarray([10, 12, 14], dtype=np.float64)
+
+
+@pytest.fixture(scope="session")
+def multi_id_data():
+    """The datasets used by setup_err_estimate_multi_ids.
 
-    We had documented that you could say conf(1, [2, 3]) but this
-    is not true, so check it does error out. Fortunately we can
-    do this without setting up any dataset or model.
+    The data is deterministic (the poisson_noise call that created it
+    used a fixed seed), so the arrays can be shared by every test
+    that loads them.
 
     """
 
-    with pytest.raises(ArgumentTypeErr,
-                       match="identifiers must be integers or strings"):
-        method(id, otherids)
+    return {1: (_MULTI_X1, _MULTI_Y1),
+            2: (_MULTI_X2, _MULTI_Y2),
+            3: (_MULTI_X3, _MULTI_Y3),
+            "not-used": (_MULTI_X_NOT_USED, _MULTI_Y_NOT_USED)}
 
 
-def setup_err_estimate_multi_ids(strings=False):
+def setup_err_estimate_multi_ids(data, id1, id2, id3):
     """Create the environment used in test_err_estimate_xxx tests.
 
     The model being fit is polynom1d with c0=50 c1=-2
     and was evaluated and passed through sherpa.utils.poisson_noise
-    to create the datasets.
+    to create the datasets (supplied via the multi_id_data fixture).
 
     Since we can have string or integer ids we allow either,
-    but do not try to mix them.
+    but do not try to mix them; the caller sends in the three
+    (already typed) identifiers.
 
     """
 
-    if strings:
-        id1 = "1"
-        id2 = "2"
-        id3 = "3"
-    else:
-        id1 = 1
-        id2 = 2
-        id3 = 3
-
-    ui.load_arrays(id1, [1, 3, 7, 12], [50, 40,27, 20])
-    ui.load_arrays(id2, [-3, 4, 5], [55, 34, 37])
-    ui.load_arrays(id3, [10, 12, 20], [24, 26, 7])
+    ui.load_arrays(id1, *data[1])
+    ui.load_arrays(id2, *data[2])
+    ui.load_arrays(id3, *data[3])
 
     # NOTE: dataset "not-used" is not used in the fit and is not
     # drawn from the distributino used to create the other datasets.
     #
-    ui.load_arrays("not-used", [2000, 2010, 2020], [10, 12, 14])
+    ui.load_arrays("not-used", *data["not-used"])
 
     mdl = ui.create_model_component("polynom1d", "mdl")
     mdl.c1.thaw()
@@ -384,38 +486,61 @@ ERR_EST_C1_MIN = -0.19798615552319254
 ERR_EST_C1_MAX = 0.21022843992924245
 
 
-@pytest.mark.parametrize("strings", [False, True])
-@pytest.mark.parametrize("idval,otherids",
-                         [(1, (2, 3)),
-                          (2, [3, 1]),
-                          (3, [2, 1])])
-def test_err_estimate_multi_ids(strings, idval, otherids, clean_ui):
+# The id orderings used by the multi-id error-estimate tests. The ids
+# are already typed, so the tests do not need to convert them, and the
+# explicit labels make the test ids self-documenting.
+#
+ID_ORDERS = [pytest.param(1, (2, 3), id="int-1-23"),
+             pytest.param(2, [3, 1], id="int-2-31"),
+             pytest.param(3, [2, 1], id="int-3-21"),
+             pytest.param("1", ("2", "3"), id="str-1-23"),
+             pytest.param("2", ["3", "1"], id="str-2-31"),
+             pytest.param("3", ["2", "1"], id="str-3-21")]
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["int", "str"])
+def fitted_env(request, multi_id_data):
+    """Set up and fit the multi-id session once per id type.
+
+    The fit dominates the run time of the test_err_estimate_xxx
+    tests, and the results do not depend on the order the ids are
+    given, so share a single fitted session (per integer/string id
+    setting) rather than re-fit for each ordering. The module scope
+    means the clean_ui fixture can not be used here, so the session
+    is cleaned up explicitly.
+
+    """
+
+    ids = ("1", "2", "3") if request.param else (1, 2, 3)
+
+    ui.clean()
+    setup_err_estimate_multi_ids(multi_id_data, *ids)
+    ui.fit(*ids)
+
+    yield request.param, ui.get_model_component("mdl")
+    ui.clean()
+
+
+@pytest.mark.parametrize("order", [(0, 1, 2), (1, 2, 0), (2, 1, 0)])
+@pytest.mark.slow
+def test_err_estimate_multi_ids(order, fitted_env):
     """Ensure we can use multiple ids with conf/proj/covar.
 
     Since this uses the same logic we only test the conf routine;
     ideally we'd use all but that's harder to test.
 
-    The fit and error analysis should be the same however the ordering
-    is done.
+    The fit (done by the fitted_env fixture) and error analysis
+    should be the same however the ordering is done.
     """
 
-    # This is a bit ugly
-    if strings:
-        idval = str(idval)
-        if type(otherids) == tuple:
-            otherids = (str(otherids[0]), str(otherids[1]))
-        else:
-            otherids = [str(otherids[0]), str(otherids[1])]
-
-    datasets = tuple([idval] + list(otherids))
-
-    setup_err_estimate_multi_ids(strings=strings)
-    ui.fit(idval, *otherids)
+    strings, mdl = fitted_env
+    ids = ("1", "2", "3") if strings else (1, 2, 3)
+    datasets = tuple(ids[i] for i in order)
 
     # The "reduced statistic" is ~0.42 for the fit.
     #
     res = ui.get_fit_results()
-    assert res.datasets == datasets
+    assert res.datasets == ids
     assert res.numpoints == 10  # sum of datasets 1, 2, 3
     assert res.statval == pytest.approx(3.379367979541458)
 
@@ -433,16 +558,15 @@ def test_err_estimate_multi_ids(strings, idval, otherids, clean_ui):
     assert res.datasets == datasets
     assert res.parnames == ("mdl.c0", "mdl.c1")
 
-    assert res.parmins == pytest.approx([ERR_EST_C0_MIN, ERR_EST_C1_MIN])
-    assert res.parmaxes == pytest.approx([ERR_EST_C0_MAX, ERR_EST_C1_MAX])
+    np.testing.assert_allclose(np.asarray(res.parmins),
+                               [ERR_EST_C0_MIN, ERR_EST_C1_MIN], rtol=1e-7)
+    np.testing.assert_allclose(np.asarray(res.parmaxes),
+                               [ERR_EST_C0_MAX, ERR_EST_C1_MAX], rtol=1e-7)
 
 
-@pytest.mark.parametrize("strings", [False, True])
-@pytest.mark.parametrize("idval,otherids",
-                         [(1, (2, 3)),
-                          (2, [3, 1]),
-                          (3, [2, 1])])
-def test_err_estimate_model(strings, idval, otherids, clean_ui):
+@pytest.mark.parametrize("idval,otherids", ID_ORDERS)
+@pytest.mark.slow
+def test_err_estimate_model(idval, otherids, multi_id_data, clean_ui):
     """Ensure we can use model with conf/proj/covar.
 
     This is test_err_estimate_multi_ids but
@@ -454,17 +578,10 @@ def test_err_estimate_model(strings, idval, otherids, clean_ui):
     is done.
     """
 
-    # This is a bit ugly
-    if strings:
-        idval = str(idval)
-        if type(otherids) == tuple:
-            otherids = (str(otherids[0]), str(otherids[1]))
-        else:
-            otherids = [str(otherids[0]), str(otherids[1])]
-
     datasets = tuple([idval] + list(otherids))
 
-    setup_err_estimate_multi_ids(strings=strings)
+    ids = ("1", "2", "3") if isinstance(idval, str) else (1, 2, 3)
+    setup_err_estimate_multi_ids(multi_id_data, *ids)
 
     zero = ui.create_model_component("scale1d", "zero")
     zero.c0 = 0
@@ -498,16 +615,15 @@ def test_err_estimate_model(strings, idval, otherids, clean_ui):
     assert res.datasets == datasets
     assert res.parnames == ("mdl.c0", "mdl.c1")
 
-    assert res.parmins == pytest.approx([ERR_EST_C0_MIN, ERR_EST_C1_MIN])
-    assert res.parmaxes == pytest.approx([ERR_EST_C0_MAX, ERR_EST_C1_MAX])
+    np.testing.assert_allclose(np.asarray(res.parmins),
+                               [ERR_EST_C0_MIN, ERR_EST_C1_MIN], rtol=1e-7)
+    np.testing.assert_allclose(np.asarray(res.parmaxes),
+                               [ERR_EST_C0_MAX, ERR_EST_C1_MAX], rtol=1e-7)
 
 
-@pytest.mark.parametrize("strings", [False, True])
-@pytest.mark.parametrize("idval,otherids",
-                         [(1, (2, 3)),
-                          (2, [3, 1]),
-                          (3, [2, 1])])
-def test_err_estimate_single_parameter(strings, idval, otherids, clean_ui):
+@pytest.mark.parametrize("order", [(0, 1, 2), (1, 2, 0), (2, 1, 0)])
+@pytest.mark.slow
+def test_err_estimate_single_parameter(order, fitted_env):
     """Ensure we can fti a single parameter with conf/proj/covar.
 
     Since this uses the same logic we only test the conf routine;
@@ -516,21 +632,13 @@ def test_err_estimate_single_parameter(strings, idval, otherids, clean_ui):
     We use the same model as test_err_estimate_multi_ids but
     here we only want to evaluate the error for the mdl.c1 component.
 
-    The fit and error analysis should be the same however the ordering
-    is done.
+    The fit (done by the fitted_env fixture) and error analysis
+    should be the same however the ordering is done.
     """
 
-    # This is a bit ugly
-    if strings:
-        idval = str(idval)
-        if type(otherids) == tuple:
-            otherids = (str(otherids[0]), str(otherids[1]))
-        else:
-            otherids = [str(otherids[0]), str(otherids[1])]
-
-    datasets = tuple([idval] + list(otherids))
-    setup_err_estimate_multi_ids(strings=strings)
-    ui.fit(idval, *otherids)
+    strings, mdl = fitted_env
+    ids = ("1", "2", "3") if strings else (1, 2, 3)
+    datasets = tuple(ids[i] for i in order)
 
     # pick an odd ordering just to check we pick it up
     ui.conf(datasets[0], mdl.c1, datasets[1], datasets[2])
@@ -539,8 +647,10 @@ def test_err_estimate_single_parameter(strings, idval, otherids, clean_ui):
     assert res.datasets == datasets
     assert res.parnames == ("mdl.c1", )
 
-    assert res.parmins == pytest.approx([ERR_EST_C1_MIN])
-    assert res.parmaxes == pytest.approx([ERR_EST_C1_MAX])
+    np.testing.assert_allclose(np.asarray(res.parmins),
+                               [ERR_EST_C1_MIN], rtol=1e-7)
+    np.testing.assert_allclose(np.asarray(res.parmaxes),
+                               [ERR_EST_C1_MAX], rtol=1e-7)
 
 
 def test_show_all_empty(clean_ui):